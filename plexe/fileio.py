@@ -7,11 +7,11 @@ import json
 import logging
 import pickle
 import tarfile
-import types
 from pathlib import Path
 
 from plexe.models import Model, ModelState
 from plexe.internal.models.entities.artifact import Artifact
+from plexe.internal.common.utils.predictor_utils import load_predictor_module
 from plexe.internal.common.utils.pydantic_utils import map_to_basemodel
 from plexe.internal.models.entities.metric import Metric, MetricComparator, ComparisonMethod
 
@@ -209,8 +209,7 @@ def load_model(path: str | Path) -> Model:
             model.predictor_source = predictor_source
 
             if predictor_source:
-                predictor_module = types.ModuleType("predictor")
-                exec(predictor_source, predictor_module.__dict__)
+                predictor_module = load_predictor_module(predictor_source)
                 model.predictor = predictor_module.PredictorImplementation(artifact_handles)
 
             model.artifacts = artifact_handles
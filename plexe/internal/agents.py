@@ -5,12 +5,15 @@ This implementation can be used both programmatically through the library interf
 and interactively through a Gradio UI.
 """
 
-import types
+import asyncio
+import threading
 import logging
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from dataclasses import dataclass, field
+from functools import cached_property
 
-from smolagents import CodeAgent, LiteLLMModel, ToolCallingAgent
+from smolagents import CodeAgent, ToolCallingAgent
+from smolagents.memory import ActionStep, FinalAnswerStep
 
 from plexe.config import config
 from plexe.internal.models.entities.artifact import Artifact
@@ -28,6 +31,7 @@ from plexe.internal.models.tools.validation import validate_inference_code, vali
 from plexe.internal.models.tools.datasets import split_datasets, create_input_sample
 from plexe.internal.models.tools.response_formatting import (
     format_final_orchestrator_agent_response,
+    format_final_mls_agent_response,
     format_final_mle_agent_response,
     format_final_mlops_agent_response,
 )
@@ -35,13 +39,21 @@ from plexe.internal.models.interfaces.predictor import Predictor
 from plexe.internal.models.entities.metric import Metric
 from plexe.internal.common.registries.objects import ObjectRegistry
 from plexe.internal.models.entities.metric import MetricComparator, ComparisonMethod
-from plexe.internal.common.utils.agents import get_prompt_templates
+from plexe.internal.common.utils.agents import (
+    CachedLiteLLMModel,
+    ParallelToolCallingAgent,
+    get_prompt_templates,
+)
+from plexe.internal.common.utils.predictor_utils import load_predictor_module
 
 
 logger = logging.getLogger(__name__)
 
+# Comparison methods indexed by name, used to parse the comparison method reported by the orchestrator
+_COMPARISON_METHODS: Dict[str, ComparisonMethod] = {m.name: m for m in ComparisonMethod}
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelGenerationResult:
     training_source_code: str
     inference_source_code: str
@@ -60,6 +72,24 @@ class PlexeAgent:
     to analyze data, plan solutions, train models, and generate inference code.
     """
 
+    # Tools available to each agent; the MLEngineer also gets an executor tool matching the 'distributed' setting
+    _MLS_TOOLS = (format_final_mls_agent_response,)
+    _MLE_TOOLS = (generate_training_code, validate_training_code, fix_training_code, format_final_mle_agent_response)
+    _MLOPS_TOOLS = (
+        split_datasets,
+        generate_inference_code,
+        validate_inference_code,
+        fix_inference_code,
+        format_final_mlops_agent_response,
+    )
+    _MANAGER_TOOLS = (
+        select_target_metric,
+        review_finalised_model,
+        split_datasets,
+        create_input_sample,
+        format_final_orchestrator_agent_response,
+    )
+
     def __init__(
         self,
         orchestrator_model_id: str = "anthropic/claude-3-7-sonnet-20250219",
@@ -91,8 +121,33 @@ class PlexeAgent:
         self.orchestrator_verbosity = 2 if verbose else 1
         self.specialist_verbosity = 1 if verbose else 1
 
-        # Create solution planner agent - plans ML approaches
-        self.ml_research_agent = ToolCallingAgent(
+        # Registry through which agents and tools share code, artifacts and other objects
+        self._object_registry = ObjectRegistry()
+
+        # LLM clients whose response caches are shared between agents that use the same model
+        self._models: Dict[str, CachedLiteLLMModel] = {}
+        self._models_lock = threading.Lock()
+
+    def _model_for(self, model_id: str) -> CachedLiteLLMModel:
+        """
+        Return a new LLM client for the given model, sharing its response cache with all other agents using it.
+
+        Each agent gets its own client, so that it tracks the token counts of its own model calls.
+
+        :param model_id: the LiteLLM identifier of the model
+        :return: a client sharing the response cache of all agents using this model
+        """
+        with self._models_lock:
+            if model_id not in self._models:
+                self._models[model_id] = CachedLiteLLMModel(model_id=model_id)
+            return self._models[model_id].share()
+
+    @cached_property
+    def ml_research_agent(self) -> ToolCallingAgent:
+        """
+        Solution planner agent - plans ML approaches. Created on first access.
+        """
+        return ToolCallingAgent(
             name="MLResearchScientist",
             description=(
                 "Expert ML researcher that develops detailed solution ideas and plans for ML use cases. "
@@ -102,16 +157,21 @@ class PlexeAgent:
                 "- output schema for the model"
                 "- the name and comparison method of the metric to optimise"
                 "- the identifier of the LLM that should be used for plan generation"
+                ". The agent returns all requested plans at once, as a list under the 'plans' key."
             ),
-            model=LiteLLMModel(model_id=self.ml_researcher_model_id),
-            tools=[],
+            model=self._model_for(self.ml_researcher_model_id),
+            tools=list(self._MLS_TOOLS),
             add_base_tools=False,
             verbosity_level=self.specialist_verbosity,
             prompt_templates=get_prompt_templates("toolcalling_agent.yaml", "mls_prompt_templates.yaml"),
         )
 
-        # Create model trainer agent - implements training code
-        self.mle_agent = ToolCallingAgent(
+    @cached_property
+    def mle_agent(self) -> ParallelToolCallingAgent:
+        """
+        Model trainer agent - implements training code. Created on first access.
+        """
+        return ParallelToolCallingAgent(
             name="MLEngineer",
             description=(
                 "Expert ML engineer that implements, trains and validates ML models based on provided plans. "
@@ -125,21 +185,19 @@ class PlexeAgent:
                 "- the working directory to use for model execution"
                 "- the identifier of the LLM that should be used for code generation"
             ),
-            model=LiteLLMModel(model_id=self.ml_engineer_model_id),
-            tools=[
-                generate_training_code,
-                validate_training_code,
-                fix_training_code,
-                get_executor_tool(distributed),
-                format_final_mle_agent_response,
-            ],
+            model=self._model_for(self.ml_engineer_model_id),
+            tools=[*self._MLE_TOOLS, get_executor_tool(self.distributed)],
             add_base_tools=False,
             verbosity_level=self.specialist_verbosity,
             prompt_templates=get_prompt_templates("toolcalling_agent.yaml", "mle_prompt_templates.yaml"),
         )
 
-        # Create predictor builder agent - creates inference code
-        self.mlops_engineer = ToolCallingAgent(
+    @cached_property
+    def mlops_engineer(self) -> ParallelToolCallingAgent:
+        """
+        Predictor builder agent - creates inference code. Created on first access.
+        """
+        return ParallelToolCallingAgent(
             name="MLOperationsEngineer",
             description=(
                 "Expert ML operations engineer that writes inference code for ML models to be used in production. "
@@ -149,30 +207,22 @@ class PlexeAgent:
                 "- the 'training code id' of the training code produced by the MLEngineer agent"
                 "- the identifier of the LLM that should be used for code generation"
             ),
-            model=LiteLLMModel(model_id=self.ml_ops_engineer_model_id),
-            tools=[
-                split_datasets,
-                generate_inference_code,
-                validate_inference_code,
-                fix_inference_code,
-                format_final_mlops_agent_response,
-            ],
+            model=self._model_for(self.ml_ops_engineer_model_id),
+            tools=list(self._MLOPS_TOOLS),
             add_base_tools=False,
             verbosity_level=self.specialist_verbosity,
             prompt_templates=get_prompt_templates("toolcalling_agent.yaml", "mlops_prompt_templates.yaml"),
             planning_interval=8,
         )
 
-        # Create orchestrator agent - coordinates the workflow
-        self.manager_agent = CodeAgent(
-            model=LiteLLMModel(model_id=self.orchestrator_model_id),
-            tools=[
-                select_target_metric,
-                review_finalised_model,
-                split_datasets,
-                create_input_sample,
-                format_final_orchestrator_agent_response,
-            ],
+    @cached_property
+    def manager_agent(self) -> CodeAgent:
+        """
+        Orchestrator agent - coordinates the workflow. Created on first access, along with its managed agents.
+        """
+        return CodeAgent(
+            model=self._model_for(self.orchestrator_model_id),
+            tools=list(self._MANAGER_TOOLS),
             managed_agents=[self.ml_research_agent, self.mle_agent, self.mlops_engineer],
             add_base_tools=False,
             verbosity_level=self.orchestrator_verbosity,
@@ -182,6 +232,77 @@ class PlexeAgent:
             planning_interval=7,
         )
 
+    async def arun(self, task, additional_args: dict) -> ModelGenerationResult:
+        """
+        Asynchronously run the orchestrator agent to generate a machine learning model.
+
+        The smolagents pipeline is synchronous, so the run is executed in a worker thread. This frees the event
+        loop for other coroutines while the agents are blocked on LLM calls. Runs must not overlap, however: agent
+        tools share objects through the process-wide ObjectRegistry under fixed names, and agents keep per-run memory.
+
+        Returns:
+            ModelGenerationResult: The result of the model generation process.
+        """
+        return await asyncio.to_thread(self.run, task, additional_args)
+
+    async def arun_batch(self, tasks: List[Tuple[str, dict]]) -> List[ModelGenerationResult | Exception]:
+        """
+        Asynchronously run the orchestrator agent on several tasks, one after another.
+
+        The agent tools share objects through the process-wide ObjectRegistry, under fixed names such as the
+        predictor input sample and the dataset splits, so the tasks cannot run concurrently. Each task runs on its
+        own copy of the agent system, since agents keep per-run memory, and the objects registered by a task are
+        removed once it completes. All copies share this instance's LLM clients, and therefore their response caches.
+
+        Args:
+            tasks: The (task, additional_args) pairs to run
+
+        Returns:
+            list: For each task, in order, either its ModelGenerationResult or the exception it raised.
+        """
+        results = []
+        for task, additional_args in tasks:
+            registered = self._object_registry.list()
+            try:
+                results.append(await self._spawn().arun(task, additional_args))
+            except Exception as e:
+                results.append(e)
+            finally:
+                self._object_registry.remove_all_except(registered)
+        return results
+
+    def _spawn(self) -> "PlexeAgent":
+        """
+        Create a copy of this agent system with its own agents, sharing this instance's LLM clients.
+        """
+        agent = PlexeAgent(
+            orchestrator_model_id=self.orchestrator_model_id,
+            ml_researcher_model_id=self.ml_researcher_model_id,
+            ml_engineer_model_id=self.ml_engineer_model_id,
+            ml_ops_engineer_model_id=self.ml_ops_engineer_model_id,
+            verbose=self.verbose,
+            max_steps=self.max_steps,
+            distributed=self.distributed,
+        )
+        agent._models, agent._models_lock = self._models, self._models_lock
+        return agent
+
+    def _run_orchestrator(self, task, additional_args: dict) -> dict:
+        """
+        Run the orchestrator agent as a stream of steps, logging progress as each step completes.
+
+        Returns:
+            dict: The final answer of the orchestrator agent.
+        """
+        result = None
+        for step in self.manager_agent.run(task=task, additional_args=additional_args, stream=True):
+            if isinstance(step, ActionStep):
+                error = f" with error: {step.error}" if step.error else ""
+                logger.debug(f"Orchestrator completed step {step.step_number} in {step.duration or 0:.1f}s{error}")
+            elif isinstance(step, FinalAnswerStep):
+                result = step.final_answer
+        return result
+
     def run(self, task, additional_args: dict) -> ModelGenerationResult:
         """
         Run the orchestrator agent to generate a machine learning model.
@@ -189,8 +310,8 @@ class PlexeAgent:
         Returns:
             ModelGenerationResult: The result of the model generation process.
         """
-        object_registry = ObjectRegistry()
-        result = self.manager_agent.run(task=task, additional_args=additional_args)
+        object_registry = self._object_registry
+        result = self._run_orchestrator(task, additional_args)
 
         try:
             # Only log the full result when in verbose mode
@@ -200,27 +321,18 @@ class PlexeAgent:
             # Extract data from the agent result
             training_code_id = result.get("training_code_id", "")
             inference_code_id = result.get("inference_code_id", "")
-            training_code = object_registry.get(Code, training_code_id).code
-            inference_code = object_registry.get(Code, inference_code_id).code
+            code = object_registry.get_multiple(Code, [training_code_id, inference_code_id])
+            training_code = code[training_code_id].code
+            inference_code = code[inference_code_id].code
 
             # Extract performance metrics
-            if "performance" in result and isinstance(result["performance"], dict):
-                metrics = result["performance"]
-            else:
-                metrics = {}
+            metrics = result.get("performance")
+            metrics = metrics if isinstance(metrics, dict) else {}
 
             metric_name = metrics.get("name", "unknown")
             metric_value = metrics.get("value", 0.0)
             comparison_str = metrics.get("comparison_method", "")
-            comparison_method_map = {
-                "HIGHER_IS_BETTER": ComparisonMethod.HIGHER_IS_BETTER,
-                "LOWER_IS_BETTER": ComparisonMethod.LOWER_IS_BETTER,
-                "TARGET_IS_BETTER": ComparisonMethod.TARGET_IS_BETTER,
-            }
-            comparison_method = ComparisonMethod.HIGHER_IS_BETTER  # Default to higher is better
-            for key, method in comparison_method_map.items():
-                if key in comparison_str:
-                    comparison_method = method
+            comparison_method = _parse_comparison_method(comparison_str)
 
             comparator = MetricComparator(comparison_method)
             performance = Metric(
@@ -229,27 +341,45 @@ class PlexeAgent:
                 comparator=comparator,
             )
 
-            # Get model artifacts from registry or result
+            # Get the model artifacts produced for the selected model from the registry
             artifact_names = result.get("model_artifact_names", [])
+            artifacts = list(object_registry.get_multiple(Artifact, artifact_names).values())
 
             # Model metadata
             metadata = result.get("metadata", {"model_type": "unknown", "framework": "unknown"})
 
             # Compile the inference code into a module
-            inference_module: types.ModuleType = types.ModuleType("predictor")
-            exec(inference_code, inference_module.__dict__)
+            inference_module = load_predictor_module(inference_code)
             # Instantiate the predictor class from the loaded module
             predictor_class = getattr(inference_module, "PredictorImplementation")
-            predictor = predictor_class(object_registry.get_all(Artifact).values())
+            predictor = predictor_class(artifacts)
 
             return ModelGenerationResult(
                 training_source_code=training_code,
                 inference_source_code=inference_code,
                 predictor=predictor,
-                model_artifacts=list(object_registry.get_multiple(Artifact, artifact_names).values()),
+                model_artifacts=artifacts,
                 performance=performance,
                 test_performance=performance,  # Using the same performance for now
                 metadata=metadata,
             )
         except Exception as e:
             raise RuntimeError(f"❌ Failed to process agent result: {str(e)}") from e
+
+
+def _parse_comparison_method(value: str) -> ComparisonMethod:
+    """
+    Parse the metric comparison method reported by the orchestrator, defaulting to higher is better.
+
+    Both 'LOWER_IS_BETTER' and 'ComparisonMethod.LOWER_IS_BETTER' are resolved with a direct lookup. The value is
+    free text written by the LLM, however, so other values are scanned for the name of a comparison method.
+
+    :param value: the reported comparison method
+    :return: the parsed comparison method
+    """
+    normalised = str(value).strip().upper()
+    method = _COMPARISON_METHODS.get(normalised.rsplit(".", 1)[-1])
+    if method is not None:
+        return method
+    matches = [method for name, method in _COMPARISON_METHODS.items() if name in normalised]
+    return matches[-1] if matches else ComparisonMethod.HIGHER_IS_BETTER
@@ -2,7 +2,7 @@
 This module provides a generic Registry pattern implementation for storing and retrieving objects by name or prefix.
 """
 
-from typing import Dict, List, Type, TypeVar
+from typing import Dict, Iterable, List, Type, TypeVar
 
 
 T = TypeVar("T")
@@ -93,6 +93,16 @@ class ObjectRegistry:
         """
         self._items.clear()
 
+    def remove_all_except(self, names: Iterable[str]) -> None:
+        """
+        Remove all registered items except the given ones.
+
+        :param names: the names of the items to keep, as returned by list()
+        """
+        keep = set(names)
+        for name in [name for name in self._items if name not in keep]:
+            del self._items[name]
+
     def list(self) -> List[str]:
         """
         List all registered item names.
@@ -2,9 +2,25 @@
 This module provides utilities for working with agents defined using the smolagents library.
 """
 
+import copy
+import functools
+import hashlib
+import threading
+import time
 import yaml
 import importlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from smolagents import LiteLLMModel, Tool, ToolCallingAgent
+from smolagents.memory import ActionStep, ToolCall
+from smolagents.models import ChatMessage, ChatMessageToolCall, get_tool_json_schema
+from smolagents.monitoring import LogLevel
+from smolagents.utils import AgentParsingError, AgentToolExecutionError
+
 from plexe.config import config
+from plexe.internal.common.utils.json_utils import dumps_canonical
 
 
 def get_prompt_templates(base_template_name: str, override_template_name: str) -> dict:
@@ -12,7 +28,14 @@ def get_prompt_templates(base_template_name: str, override_template_name: str) -
     Given the name of a smolagents prompt template (the 'base template') and a plexe prompt template
     (the 'overriding template'), this function loads both templates and returns a merged template in which
     all keys from the overriding template overwrite the matching keys in the base template.
+
+    The templates are parsed once per process; each call returns a copy, so callers may modify the result.
     """
+    return copy.deepcopy(_load_prompt_templates(base_template_name, override_template_name))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_prompt_templates(base_template_name: str, override_template_name: str) -> dict:
     base_template: dict = yaml.safe_load(
         importlib.resources.files("smolagents.prompts").joinpath(base_template_name).read_text()
     )
@@ -35,3 +58,210 @@ def get_prompt_templates(base_template_name: str, override_template_name: str) -
         return base
 
     return merge_dicts(base_template, override_template)
+
+
+class CachedLiteLLMModel(LiteLLMModel):
+    """
+    A LiteLLMModel that caches responses in memory, keyed on a SHA-256 hash of the full completion request.
+
+    Agent retries and repeated runs frequently resubmit identical prompts; serving these from the cache avoids
+    a full LLM round-trip. Entries expire after 'ttl' seconds, and the least recently used entries are evicted once
+    the cache holds 'max_entries' responses.
+    """
+
+    def __init__(self, model_id: str, max_entries: int = 1024, ttl: Optional[float] = 3600, **kwargs):
+        """
+        :param model_id: the LiteLLM identifier of the model to call
+        :param max_entries: maximum number of responses to keep in the cache
+        :param ttl: number of seconds after which a cached response expires, or None to never expire
+        :param kwargs: additional keyword arguments passed to LiteLLMModel
+        """
+        super().__init__(model_id=model_id, **kwargs)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._cache: OrderedDict[str, Tuple[float, ChatMessage]] = OrderedDict()
+        # The cache is shared by the clients returned by share(), which may be used from different threads
+        self._lock = threading.Lock()
+
+    def __call__(
+        self,
+        messages: List[Dict[str, Any]],
+        stop_sequences: Optional[List[str]] = None,
+        grammar: Optional[str] = None,
+        tools_to_call_from: Optional[List[Tool]] = None,
+        **kwargs,
+    ) -> ChatMessage:
+        key = self._cache_key(messages, stop_sequences, grammar, tools_to_call_from, **kwargs)
+        with self._lock:
+            cached = self._lookup(key)
+
+        if cached is not None:
+            # No tokens are consumed when the response is served from the cache
+            self.last_input_token_count = 0
+            self.last_output_token_count = 0
+            # Agents may modify the returned message, so callers always receive their own copy
+            return copy.deepcopy(cached)
+
+        response = super().__call__(messages, stop_sequences, grammar, tools_to_call_from, **kwargs)
+        with self._lock:
+            self._store(key, response)
+        return response
+
+    def share(self) -> "CachedLiteLLMModel":
+        """
+        Return a new client for the same model, which shares this client's response cache.
+
+        Each agent should use its own client: smolagents reads the token counts of an agent's last model call from
+        the client, and agents sharing a client would overwrite each other's counts.
+
+        :return: a client sharing this client's cache, with its own token counts
+        """
+        client = copy.copy(self)
+        client.last_input_token_count = None
+        client.last_output_token_count = None
+        return client
+
+    def _cache_key(
+        self,
+        messages: List[Dict[str, Any]],
+        stop_sequences: Optional[List[str]],
+        grammar: Optional[str],
+        tools_to_call_from: Optional[List[Tool]],
+        **kwargs,
+    ) -> str:
+        """
+        Compute a hash uniquely identifying a completion request, including the model and its sampling settings.
+        """
+        canonical = {
+            "model_id": self.model_id,
+            "model_kwargs": self.kwargs,
+            "messages": messages,
+            "stop_sequences": stop_sequences,
+            "grammar": grammar,
+            "tools": [get_tool_json_schema(tool) for tool in tools_to_call_from or []],
+            "kwargs": kwargs,
+        }
+        return hashlib.sha256(dumps_canonical(canonical)).hexdigest()
+
+    def _lookup(self, key: str) -> Optional[ChatMessage]:
+        """
+        Return the cached response for a request, if present and not expired. The caller must hold the lock.
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        created_at, message = entry
+        if self.ttl is not None and time.monotonic() - created_at > self.ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return message
+
+    def _store(self, key: str, message: ChatMessage) -> None:
+        """
+        Store a copy of a response in the cache. The caller must hold the lock.
+        """
+        self._cache[key] = (time.monotonic(), copy.deepcopy(message))
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+
+class ParallelToolCallingAgent(ToolCallingAgent):
+    """
+    A ToolCallingAgent that executes all the tool calls requested by the model in a step, running them in parallel.
+
+    The base ToolCallingAgent only executes the first tool call in each model response. When the model requests
+    several tools at once, this agent executes all of them concurrently in a thread pool, so the step takes as long
+    as the slowest tool rather than the sum of all tools. Steps with a single tool call, or that call 'final_answer',
+    are handled by the base class.
+    """
+
+    def __init__(self, *args, max_parallel_tool_calls: int = 4, **kwargs):
+        """
+        :param max_parallel_tool_calls: maximum number of tool calls to execute at the same time
+        :param args: positional arguments passed to ToolCallingAgent
+        :param kwargs: keyword arguments passed to ToolCallingAgent
+        """
+        super().__init__(*args, **kwargs)
+        self.max_parallel_tool_calls = max_parallel_tool_calls
+
+    # step and _replay_step mirror ToolCallingAgent.step of the pinned smolagents==1.13.0: step repeats its model
+    # call and bookkeeping, and _replay_step relies on it reading the model from self.model. Both must be reviewed
+    # whenever smolagents is upgraded.
+    def step(self, memory_step: ActionStep) -> Any:
+        memory_messages = self.write_memory_to_messages()
+        self.input_messages = memory_messages
+        memory_step.model_input_messages = memory_messages.copy()
+
+        try:
+            model_message: ChatMessage = self.model(
+                memory_messages,
+                tools_to_call_from=list(self.tools.values()),
+                stop_sequences=["Observation:", "Calling tools:"],
+            )
+        except Exception as e:
+            raise AgentParsingError(f"Error while generating or parsing output:\n{e}", self.logger) from e
+
+        tool_calls = model_message.tool_calls or []
+        if len(tool_calls) < 2 or any(call.function.name == "final_answer" for call in tool_calls):
+            return self._replay_step(memory_step, model_message)
+
+        memory_step.model_output_message = model_message
+        self.logger.log_markdown(
+            content=model_message.content if model_message.content else str(model_message.raw),
+            title="Output message of the LLM:",
+            level=LogLevel.DEBUG,
+        )
+        memory_step.tool_calls = [
+            ToolCall(name=call.function.name, arguments=call.function.arguments, id=call.id) for call in tool_calls
+        ]
+        self._execute_tool_calls(memory_step, tool_calls)
+        return None
+
+    def _replay_step(self, memory_step: ActionStep, model_message: ChatMessage) -> Any:
+        """
+        Run the base class step, replaying the message already generated by the model instead of calling it again.
+        """
+        model = self.model
+        self.model = lambda *args, **kwargs: model_message
+        try:
+            return super().step(memory_step)
+        finally:
+            self.model = model
+
+    def _execute_tool_calls(self, memory_step: ActionStep, tool_calls: List[ChatMessageToolCall]) -> None:
+        """
+        Execute the tool calls in parallel and record their observations in the memory step. If any tool calls
+        fail, the observations of the successful calls are still recorded, and an error listing every failed call
+        is raised.
+        """
+        self.logger.log(
+            f"Calling tools in parallel: {[(call.function.name, call.function.arguments) for call in tool_calls]}",
+            level=LogLevel.INFO,
+        )
+
+        def execute(call: ChatMessageToolCall) -> Tuple[Any, Optional[Exception]]:
+            try:
+                return self.execute_tool_call(call.function.name, call.function.arguments or {}), None
+            except Exception as e:
+                return None, e
+
+        with ThreadPoolExecutor(max_workers=min(len(tool_calls), self.max_parallel_tool_calls)) as executor:
+            results = list(executor.map(execute, tool_calls))
+
+        memory_step.observations = "\n\n".join(
+            f"Observation from tool '{call.function.name}' (call id: {call.id}):\n{str(output).strip()}"
+            for call, (output, error) in zip(tool_calls, results)
+            if error is None
+        )
+        self.logger.log(f"Observations: {memory_step.observations.replace('[', '|')}", level=LogLevel.INFO)
+
+        failures = [(call, error) for call, (_, error) in zip(tool_calls, results) if error is not None]
+        if failures:
+            # Report every failed call, so that the model can retry each of them
+            raise AgentToolExecutionError(
+                f"{len(failures)} of {len(tool_calls)} parallel tool calls failed:\n"
+                + "\n".join(f"- tool '{call.function.name}' (call id: {call.id}): {error}" for call, error in failures),
+                self.logger,
+            )
@@ -0,0 +1,46 @@
+"""
+This module provides JSON serialisation helpers for performance-sensitive code paths. The helpers use orjson
+when it is installed, and fall back to the standard library json module otherwise.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_canonical(obj: Any, default: Optional[Callable[[Any], Any]] = str) -> bytes:
+    """
+    Serialise an object to compact JSON bytes with sorted keys, such that equal objects produce equal output.
+    Values which are not natively JSON serialisable are converted using 'default', which defaults to their string
+    representation.
+
+    :param obj: the object to serialise
+    :param default: function converting unsupported values to serialisable ones, or None to raise a TypeError
+    :return: the UTF-8 encoded JSON representation of the object
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # orjson is stricter than json, e.g. for integers above 64 bits, so defer to json for these cases
+            pass
+    return json.dumps(obj, sort_keys=True, default=default, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_indented(obj: Any) -> str:
+    """
+    Serialise an object to a human-readable JSON string, indented by two spaces.
+
+    :param obj: the object to serialise
+    :return: the indented JSON representation of the object
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2)
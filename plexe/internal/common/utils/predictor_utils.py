@@ -0,0 +1,80 @@
+"""
+This module provides utility functions for compiling and loading the code of generated predictors.
+
+All predictor code is compiled through compile_predictor_code, so that it behaves the same way when it is
+validated, when the built model serves predictions, and when a saved model is loaded again.
+"""
+
+import hashlib
+import importlib.util
+import linecache
+import sys
+import threading
+import types
+from collections import OrderedDict
+
+# Predictor modules compiled previously, keyed by the SHA-256 hash of their source code. Only the most recently
+# used modules are kept, and evicted modules are also removed from sys.modules and linecache.
+_MODULE_CACHE: OrderedDict[str, types.ModuleType] = OrderedDict()
+_MODULE_CACHE_SIZE = 32
+_MODULE_CACHE_LOCK = threading.Lock()
+
+
+def compile_predictor_code(code: str, filename: str = "<predictor>") -> types.CodeType:
+    """
+    Compile predictor code with optimisation level 2, which strips docstrings and assert statements from the
+    predictor, as neither is needed to serve predictions.
+
+    :param code: the source code of the predictor module
+    :param filename: the filename reported in tracebacks
+    :return: the compiled code object
+    """
+    return compile(code, filename, "exec", optimize=2)
+
+
+def load_predictor_module(code: str) -> types.ModuleType:
+    """
+    Compile the predictor code into a module, reusing the module compiled previously for the same code.
+
+    The module is registered in sys.modules, and its source in linecache, under names derived from the hash of the
+    code. These entries are removed when the module is evicted from the cache of recently used modules; predictors
+    created from an evicted module keep working, but are no longer importable by name.
+
+    :param code: the source code of the predictor module
+    :return: the module in which the predictor code has been executed
+    """
+    key = hashlib.sha256(code.encode("utf-8")).hexdigest()
+    with _MODULE_CACHE_LOCK:
+        module = _MODULE_CACHE.get(key)
+        if module is not None:
+            _MODULE_CACHE.move_to_end(key)
+            return module
+
+        filename = f"<predictor:{key}>"
+        code_obj = compile_predictor_code(code, filename)
+        # Make the source available to tracebacks, which cannot read it from the pseudo-filename
+        linecache.cache[filename] = (len(code), None, code.splitlines(True), filename)
+
+        # Give the module a proper spec and register it, so that imports within the generated code resolve
+        spec = importlib.util.spec_from_loader(f"plexe_predictor_{key}", loader=None)
+        module = importlib.util.module_from_spec(spec)
+        module.__file__ = filename
+        sys.modules[spec.name] = module
+        try:
+            exec(code_obj, module.__dict__)
+        except BaseException:
+            _unregister_module(module)
+            raise
+
+        _MODULE_CACHE[key] = module
+        while len(_MODULE_CACHE) > _MODULE_CACHE_SIZE:
+            _unregister_module(_MODULE_CACHE.popitem(last=False)[1])
+        return module
+
+
+def _unregister_module(module: types.ModuleType) -> None:
+    """
+    Remove a predictor module from sys.modules, and its source from linecache.
+    """
+    sys.modules.pop(module.__spec__.name, None)
+    linecache.cache.pop(module.__file__, None)
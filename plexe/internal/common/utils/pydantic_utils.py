@@ -2,7 +2,9 @@
 This module provides utility functions for manipulating Pydantic models.
 """
 
-from pydantic import BaseModel, create_model
+import functools
+
+from pydantic import BaseModel, TypeAdapter, create_model
 from typing import Type, List, Dict, get_type_hints
 
 
@@ -84,7 +86,17 @@ def format_schema(schema: Type[BaseModel]) -> Dict[str, str]:
     """
     if not schema:
         return {}
+    if not isinstance(schema, type):
+        return _format_schema(schema)
+
+    # Model classes are immutable in practice, so their formatted schema is cached; return a copy to callers
+    return dict(_format_schema_cached(schema))
 
+
+def _format_schema(schema: Type[BaseModel]) -> Dict[str, str]:
+    """
+    Format a schema model without caching; see format_schema.
+    """
     result = {}
     # Use model_fields which is the recommended approach in newer Pydantic versions
     for field_name, field_info in schema.model_fields.items():
@@ -94,6 +106,21 @@ def format_schema(schema: Type[BaseModel]) -> Dict[str, str]:
     return result
 
 
+_format_schema_cached = functools.lru_cache(maxsize=256)(_format_schema)
+
+
+@functools.lru_cache(maxsize=256)
+def get_type_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """
+    Return a TypeAdapter for validating data against a schema model. Adapters are created once per model class
+    and reused, so that repeated validation does not resolve the schema again.
+
+    :param schema: A pydantic model defining a schema
+    :return: A TypeAdapter for the schema
+    """
+    return TypeAdapter(schema)
+
+
 def convert_schema_to_type_dict(schema: Type[BaseModel]) -> Dict[str, type]:
     """
     Convert a Pydantic model to a dictionary mapping field names to their Python types.
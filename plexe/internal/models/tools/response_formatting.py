@@ -52,6 +52,30 @@ def format_final_orchestrator_agent_response(
     }
 
 
+@tool
+def format_final_mls_agent_response(plans: List[Dict[str, str]]) -> dict:
+    """
+    Returns a dictionary containing the exact fields that the agent must return in its final response. All the
+    solution plans MUST be submitted together in a single call to this tool. Each plan is a dictionary with the
+    keys 'headline' (the short version of the plan) and 'plan' (the detailed version of the plan).
+
+    Args:
+        plans: The list of all solution plans, each a dictionary with the keys 'headline' and 'plan'
+
+    Returns:
+        Dictionary containing the fields that must be returned by the agent in its final response
+    """
+    if not isinstance(plans, list) or not plans:
+        raise ValueError(f"Expected a non-empty list of plans, got {type(plans).__name__}: {plans!r}")
+    invalid = [
+        i for i, plan in enumerate(plans) if not (isinstance(plan, dict) and plan.get("headline") and plan.get("plan"))
+    ]
+    if invalid:
+        raise ValueError(f"Expected plans with 'headline' and 'plan' keys, got invalid plans at positions {invalid}")
+
+    return {"plans": [{"headline": plan["headline"], "plan": plan["plan"]} for plan in plans]}
+
+
 @tool
 def format_final_mle_agent_response(
     training_code_id: str,
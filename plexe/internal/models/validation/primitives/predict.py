@@ -12,6 +12,7 @@ import pandas as pd
 
 from pydantic import BaseModel
 
+from plexe.internal.common.utils.predictor_utils import compile_predictor_code
 from plexe.internal.models.validation.validator import Validator, ValidationResult
 from plexe.internal.models.interfaces.predictor import Predictor
 
@@ -72,7 +73,7 @@ class PredictorValidator(Validator):
             warnings.simplefilter("ignore")
             module = types.ModuleType("test_predictor")
             try:
-                exec(code, module.__dict__)
+                exec(compile_predictor_code(code), module.__dict__)
             except Exception as e:
                 raise RuntimeError(f"Failed to load predictor: {str(e)}")
         return module
@@ -29,27 +29,30 @@ Example:
 >>>    print(prediction)
 """
 
+import copy
+import functools
+import hashlib
 import os
-import json
 import logging
+import math
+import threading
 import uuid
-from typing import Dict, List, Type, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Type, Any, Optional
 from datetime import datetime
 
 import pandas as pd
 from pydantic import BaseModel
 
-from plexe.config import prompt_templates
 from plexe.constraints import Constraint
 from plexe.datasets import DatasetGenerator
 from plexe.callbacks import Callback, BuildStateInfo
-from plexe.internal.agents import PlexeAgent
 from plexe.internal.common.datasets.interface import Dataset, TabularConvertible
-from plexe.internal.common.datasets.adapter import DatasetAdapter
-from plexe.internal.common.provider import Provider, ProviderConfig
 from plexe.internal.common.registries.objects import ObjectRegistry
+from plexe.internal.common.utils.json_utils import dumps_canonical, dumps_indented
 from plexe.internal.common.utils.model_utils import calculate_model_size, format_code_snippet
-from plexe.internal.common.utils.pydantic_utils import map_to_basemodel, format_schema
+from plexe.internal.common.utils.pydantic_utils import map_to_basemodel, format_schema, get_type_adapter
 from plexe.internal.common.utils.model_state import ModelState
 from plexe.internal.models.entities.artifact import Artifact
 from plexe.internal.models.entities.description import (
@@ -61,11 +64,77 @@ from plexe.internal.models.entities.description import (
 )
 from plexe.internal.models.entities.metric import Metric
 from plexe.internal.models.interfaces.predictor import Predictor
-from plexe.internal.schemas.resolver import SchemaResolver
+
+if TYPE_CHECKING:
+    from plexe.internal.common.provider import ProviderConfig
+    from plexe.internal.schemas.resolver import SchemaResolver
 
 
 logger = logging.getLogger(__name__)
 
+# Fields of the model description which are read from the model metadata, as (field name, metadata key) pairs
+_DESCRIPTION_METADATA_FIELDS = (
+    ("training_date", "creation_date"),
+    ("rationale", "selection_rationale"),
+    ("provider", "provider"),
+    ("task_type", "task_type"),
+    ("domain", "domain"),
+    ("behavior", "behavior"),
+    ("preprocessing_summary", "preprocessing_summary"),
+    ("architecture_summary", "architecture_summary"),
+    ("training_procedure", "training_procedure"),
+    ("evaluation_metric", "evaluation_metric"),
+    ("inference_behavior", "inference_behavior"),
+    ("strengths", "strengths"),
+    ("limitations", "limitations"),
+)
+
+
+@functools.singledispatch
+def _to_provider_config(provider: "ProviderConfig") -> "ProviderConfig":
+    """
+    Return the provider configuration to use for a build; a ProviderConfig is used as is.
+
+    :param provider: the provider configuration
+    :return: the provider configuration
+    """
+    return provider
+
+
+@_to_provider_config.register(str)
+def _str_to_provider_config(provider: str) -> "ProviderConfig":
+    """
+    Create a provider configuration which uses the given provider for all agent roles.
+
+    :param provider: the provider to use, e.g. "openai/gpt-4o-mini"
+    :return: the provider configuration
+    """
+    from plexe.internal.common.provider import ProviderConfig
+
+    return ProviderConfig(default_provider=provider)
+
+
+def _is_cacheable_input(value: Any) -> bool:
+    """
+    Check whether a prediction input can be cached under its canonical JSON serialisation. This is the case when
+    the input consists only of dicts with string keys, lists, strings, integers, booleans, None and finite floats,
+    whose serialisation is distinct for distinct inputs. Other values may collide: for example, tuples serialise
+    like lists, integer keys like string keys, and NaN like None.
+
+    :param value: the prediction input
+    :return: whether the input can be cached
+    """
+    value_type = type(value)
+    if value_type is float:
+        return math.isfinite(value)
+    if value_type in (str, int, bool, type(None)):
+        return True
+    if value_type is list:
+        return all(_is_cacheable_input(item) for item in value)
+    if value_type is dict:
+        return all(type(key) is str and _is_cacheable_input(item) for key, item in value.items())
+    return False
+
 
 class Model:
     """
@@ -93,6 +162,31 @@ class Model:
         )
     """
 
+    __slots__ = (
+        "intent",
+        "input_schema",
+        "output_schema",
+        "constraints",
+        "training_data",
+        "distributed",
+        "state",
+        "predictor",
+        "trainer_source",
+        "predictor_source",
+        "artifacts",
+        "_metric",
+        "_metrics_cache",
+        "metadata",
+        "predict_cache_size",
+        "_predict_cache",
+        "_predict_cache_lock",
+        "schema_resolver",
+        "object_registry",
+        "identifier",
+        "run_id",
+        "working_dir",
+    )
+
     def __init__(
         self,
         intent: str,
@@ -100,6 +194,7 @@ class Model:
         output_schema: Type[BaseModel] | Dict[str, type] = None,
         constraints: List[Constraint] = None,
         distributed: bool = False,
+        predict_cache_size: int = 0,
     ):
         """
         Initialise a model with a natural language description of its intent, as well as
@@ -111,6 +206,8 @@ class Model:
         :param constraints: A list of Constraint objects that represent rules which must be
             satisfied by every input/output pair for the model.
         :param distributed: Whether to use distributed training with Ray if available.
+        :param predict_cache_size: maximum number of predictions to cache for repeated inputs, or 0 to disable
+            caching; only enable this for models whose predictions are deterministic.
         """
         # todo: analyse natural language inputs and raise errors where applicable
 
@@ -131,22 +228,46 @@ class Model:
         self.metric: Metric | None = None
         self.metadata: Dict[str, str] = dict()  # todo: initialise metadata, etc
 
+        # Cache of recent predictions, keyed on a hash of the input
+        self.predict_cache_size: int = predict_cache_size
+        self._predict_cache: OrderedDict[bytes, Any] = OrderedDict()
+        self._predict_cache_lock = threading.Lock()
+
         # Generator objects used to create schemas, datasets, and the model itself
-        self.schema_resolver: SchemaResolver | None = None
+        self.schema_resolver: "SchemaResolver | None" = None
 
         # Registries used to make datasets, artifacts and other objects available across the system
         self.object_registry = ObjectRegistry()
 
-        # Setup the working directory and unique identifiers
-        self.identifier: str = f"model-{abs(hash(self.intent))}-{str(uuid.uuid4())}"
-        self.run_id = f"run-{datetime.now().isoformat()}".replace(":", "-").replace(".", "-")
+        # Setup the working directory and unique identifiers; the directory itself is created when building
+        intent_digest = hashlib.blake2b(self.intent.encode("utf-8"), digest_size=8).hexdigest()
+        self.identifier: str = f"model-{intent_digest}-{uuid.uuid4()}"
+        self.run_id = datetime.now().strftime("run-%Y%m%d-%H%M%S-%f")
         self.working_dir = f"./workdir/{self.run_id}/"
-        os.makedirs(self.working_dir, exist_ok=True)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Return the state of the model for copying and pickling. Locks cannot be copied, so the prediction cache
+        and its lock are left out, and recreated empty by __setstate__.
+        :return: the state of the model
+        """
+        excluded = ("_predict_cache", "_predict_cache_lock")
+        return {name: getattr(self, name) for name in self.__slots__ if name not in excluded and hasattr(self, name)}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restore the state of the model from __getstate__, with an empty prediction cache.
+        :param state: the state of the model
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._predict_cache = OrderedDict()
+        self._predict_cache_lock = threading.Lock()
 
     def build(
         self,
         datasets: List[pd.DataFrame | DatasetGenerator],
-        provider: str | ProviderConfig = "openai/gpt-4o-mini",
+        provider: "str | ProviderConfig" = "openai/gpt-4o-mini",
         timeout: int = None,
         max_iterations: int = None,
         run_timeout: int = 1800,
@@ -166,10 +287,18 @@ class Model:
         :param verbose: whether to display detailed agent logs during model building (default: False)
         :return:
         """
+        # The agent system and its dependencies are only needed for building, so they are imported on first use
+        from plexe.config import prompt_templates
+        from plexe.internal.agents import PlexeAgent
+        from plexe.internal.common.datasets.adapter import DatasetAdapter
+        from plexe.internal.common.provider import Provider
+        from plexe.internal.schemas.resolver import SchemaResolver
+
         # Ensure the object registry is cleared before building
         self.object_registry.clear()
         # Register all callbacks in the object registry
         self.object_registry.register_multiple(Callback, {f"{i}": c for i, c in enumerate(callbacks or [])})
+        registered_callbacks = list(self.object_registry.get_all(Callback).values())
 
         # Ensure timeout, max_iterations, and run_timeout make sense
         if timeout is None and max_iterations is None:
@@ -180,21 +309,24 @@ class Model:
         # TODO: validate that schema features are present in the dataset
         # TODO: validate that datasets do not contain duplicate features
         try:
+            os.makedirs(self.working_dir, exist_ok=True)
+
             # Convert string provider to config if needed
-            if isinstance(provider, str):
-                provider_config = ProviderConfig(default_provider=provider)
-            else:
-                provider_config = provider
+            provider_config = _to_provider_config(provider)
 
             # We use the tool_provider for schema resolution and tool operations
             provider_obj = Provider(model=provider_config.tool_provider)
             self.state = ModelState.BUILDING
 
             # Step 1: coerce datasets to supported formats and register them
-            self.training_data = {
-                f"dataset_{i}": DatasetAdapter.coerce((data.data if isinstance(data, DatasetGenerator) else data))
-                for i, data in enumerate(datasets)
-            }
+            # Datasets are coerced in parallel, as the conversion is mostly pandas work that releases the GIL
+            raw_datasets = [data.data if isinstance(data, DatasetGenerator) else data for data in datasets]
+            if len(raw_datasets) > 1:
+                with ThreadPoolExecutor(max_workers=min(8, len(raw_datasets))) as executor:
+                    coerced = list(executor.map(DatasetAdapter.coerce, raw_datasets))
+            else:
+                coerced = [DatasetAdapter.coerce(data) for data in raw_datasets]
+            self.training_data = {f"dataset_{i}": data for i, data in enumerate(coerced)}
             self.object_registry.register_multiple(TabularConvertible, self.training_data)
 
             # Step 2: resolve schemas
@@ -207,34 +339,37 @@ class Model:
             elif self.input_schema is None:
                 self.input_schema, _ = self.schema_resolver.resolve(self.training_data)
 
-            # Run callbacks for build start
-            for callback in self.object_registry.get_all(Callback).values():
+            # Run callbacks for build start; the build state is created once and shared by all callbacks
+            # Note: callbacks still receive the actual dataset objects for backward compatibility
+            datasets_snapshot = {
+                name: self.object_registry.get(TabularConvertible, name) for name in self.training_data
+            }
+            build_start_info = BuildStateInfo(
+                intent=self.intent,
+                input_schema=self.input_schema,
+                output_schema=self.output_schema,
+                provider=provider_config.tool_provider,  # Use tool_provider for callbacks
+                run_timeout=run_timeout,
+                max_iterations=max_iterations,
+                timeout=timeout,
+                datasets=datasets_snapshot,
+            )
+            for callback in registered_callbacks:
                 try:
-                    # Note: callbacks still receive the actual dataset objects for backward compatibility
-                    callback.on_build_start(
-                        BuildStateInfo(
-                            intent=self.intent,
-                            input_schema=self.input_schema,
-                            output_schema=self.output_schema,
-                            provider=provider_config.tool_provider,  # Use tool_provider for callbacks
-                            run_timeout=run_timeout,
-                            max_iterations=max_iterations,
-                            timeout=timeout,
-                            datasets={
-                                name: self.object_registry.get(TabularConvertible, name)
-                                for name in self.training_data.keys()
-                            },
-                        )
-                    )
+                    callback.on_build_start(build_start_info)
                 except Exception as e:
                     logger.warning(f"Error in callback {callback.__class__.__name__}.on_build_start: {e}")
 
             # Step 3: generate model
+            # Format the schemas once, for use in both the agent prompt and the agent's arguments
+            input_schema_fmt = format_schema(self.input_schema)
+            output_schema_fmt = format_schema(self.output_schema)
+
             # Start the model generation run
             agent_prompt = prompt_templates.agent_builder_prompt(
                 intent=self.intent,
-                input_schema=json.dumps(format_schema(self.input_schema), indent=4),
-                output_schema=json.dumps(format_schema(self.output_schema), indent=4),
+                input_schema=dumps_indented(input_schema_fmt),
+                output_schema=dumps_indented(output_schema_fmt),
                 datasets=list(self.training_data.keys()),
                 working_dir=self.working_dir,
                 max_iterations=max_iterations,
@@ -253,8 +388,8 @@ class Model:
                 additional_args={
                     "intent": self.intent,
                     "working_dir": self.working_dir,
-                    "input_schema": format_schema(self.input_schema),
-                    "output_schema": format_schema(self.output_schema),
+                    "input_schema": input_schema_fmt,
+                    "output_schema": output_schema_fmt,
                     "provider": provider_config.tool_provider,  # Use tool_provider for tool operations
                     "max_iterations": max_iterations,
                     "timeout": timeout,
@@ -263,24 +398,19 @@ class Model:
             )
 
             # Run callbacks for build end
-            for callback in self.object_registry.get_all(Callback).values():
+            build_end_info = BuildStateInfo(
+                intent=self.intent,
+                input_schema=self.input_schema,
+                output_schema=self.output_schema,
+                provider=provider,
+                run_timeout=run_timeout,
+                max_iterations=max_iterations,
+                timeout=timeout,
+                datasets=datasets_snapshot,
+            )
+            for callback in registered_callbacks:
                 try:
-                    # Note: callbacks still receive the actual dataset objects for backward compatibility
-                    callback.on_build_end(
-                        BuildStateInfo(
-                            intent=self.intent,
-                            input_schema=self.input_schema,
-                            output_schema=self.output_schema,
-                            provider=provider,
-                            run_timeout=run_timeout,
-                            max_iterations=max_iterations,
-                            timeout=timeout,
-                            datasets={
-                                name: self.object_registry.get(TabularConvertible, name)
-                                for name in self.training_data.keys()
-                            },
-                        )
-                    )
+                    callback.on_build_end(build_end_info)
                 except Exception as e:
                     logger.warning(f"Error in callback {callback.__class__.__name__}.on_build_end: {e}")
 
@@ -288,6 +418,9 @@ class Model:
             self.trainer_source = generated.training_source_code
             self.predictor_source = generated.inference_source_code
             self.predictor = generated.predictor
+            # Replace, rather than clear, the prediction cache: predictions still running on the previous predictor
+            # write to the cache they started with, so their results never reach the new cache
+            self._predict_cache = OrderedDict()
             self.artifacts = generated.model_artifacts
 
             # Convert Metric object to a dictionary with the entire metric object as the value
@@ -297,27 +430,19 @@ class Model:
             self.metadata.update(generated.metadata)
 
             # Store provider information in metadata
-            self.metadata["provider"] = str(provider_config.default_provider)
-            self.metadata["orchestrator_provider"] = str(provider_config.orchestrator_provider)
-            self.metadata["research_provider"] = str(provider_config.research_provider)
-            self.metadata["engineer_provider"] = str(provider_config.engineer_provider)
-            self.metadata["ops_provider"] = str(provider_config.ops_provider)
-            self.metadata["tool_provider"] = str(provider_config.tool_provider)
+            self.metadata.update(
+                {
+                    "provider": str(provider_config.default_provider),
+                    "orchestrator_provider": str(provider_config.orchestrator_provider),
+                    "research_provider": str(provider_config.research_provider),
+                    "engineer_provider": str(provider_config.engineer_provider),
+                    "ops_provider": str(provider_config.ops_provider),
+                    "tool_provider": str(provider_config.tool_provider),
+                }
+            )
 
             self.state = ModelState.READY
 
-            # Run callbacks for 'on_build_end' event
-            for callback in self.object_registry.get_all(Callback).values():
-                try:
-                    callback.on_build_end(
-                        BuildStateInfo(
-                            intent=self.intent,
-                            provider=provider_config.tool_provider,  # Use tool_provider for callbacks
-                        )
-                    )
-                except Exception as e:
-                    logger.warning(f"Error in callback {callback.__class__.__name__}.on_build_end: {e}")
-
         except Exception as e:
             self.state = ModelState.ERROR
             logger.error(f"Error during model building: {str(e)}")
@@ -335,14 +460,70 @@ class Model:
             raise RuntimeError("The model is not ready for predictions.")
         try:
             if validate_input:
-                self.input_schema.model_validate(x)
-            y = self.predictor.predict(x)
+                get_type_adapter(self.input_schema).validate_python(x)
+            y = self._predict_cached(x) if self.predict_cache_size > 0 else self.predictor.predict(x)
             if validate_output:
-                self.output_schema.model_validate(y)
+                get_type_adapter(self.output_schema).validate_python(y)
             return y
         except Exception as e:
             raise RuntimeError(f"Error during prediction: {str(e)}") from e
 
+    def _predict_cached(self, x: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Call the predictor with input x, serving the output from the prediction cache when the same input has been
+        seen before. Inputs which cannot be keyed unambiguously are never cached; see _is_cacheable_input.
+        :param x: input to the model
+        :return: output of the model
+        """
+        key = self._predict_cache_key(x)
+        if key is None:
+            return self.predictor.predict(x)
+
+        # The cache is read before the predictor, as build() replaces the predictor before the cache
+        cache = self._predict_cache
+        with self._predict_cache_lock:
+            hit = key in cache
+            if hit:
+                cache.move_to_end(key)
+                y = cache[key]
+        if not hit:
+            # The predictor is called without holding the lock, so that predictions can run concurrently
+            y = self.predictor.predict(x)
+            with self._predict_cache_lock:
+                cache[key] = y
+                while len(cache) > self.predict_cache_size:
+                    cache.popitem(last=False)
+        # Callers may modify the returned prediction, so they always receive their own copy
+        return copy.deepcopy(y)
+
+    @staticmethod
+    def _predict_cache_key(x: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Compute a hash uniquely identifying a prediction input, or None if the input cannot be cached.
+        :param x: input to the model
+        :return: the hash of the input, or None
+        """
+        if not _is_cacheable_input(x):
+            return None
+        return hashlib.blake2b(dumps_canonical(x, default=None), digest_size=16).digest()
+
+    @property
+    def metric(self) -> Metric | None:
+        """
+        Return the performance metric of the model, if it has been built.
+        :return: the performance metric of the model
+        """
+        return self._metric
+
+    @metric.setter
+    def metric(self, metric: Metric | None) -> None:
+        """
+        Set the performance metric of the model, updating the metrics returned by get_metrics.
+        :param metric: the performance metric of the model
+        """
+        self._metric = metric
+        self._metrics_cache = None if metric is None else {metric.name: metric.value}
+
     def get_state(self) -> ModelState:
         """
         Return the current state of the model.
@@ -359,10 +540,10 @@ class Model:
 
     def get_metrics(self) -> dict:
         """
-        Return metrics about the model.
+        Return metrics about the model. The same dictionary is returned on each call until the metric changes.
         :return: metrics about the model
         """
-        return None if self.metric is None else {self.metric.name: self.metric.value}
+        return self._metrics_cache
 
     def describe(self) -> ModelDescription:
         """
@@ -388,21 +569,19 @@ class Model:
 
         # Create performance info
         # Convert Metric objects to string representation for JSON serialization
-        metrics_dict = {}
-        if hasattr(self.metric, "value") and hasattr(self.metric, "name"):  # Check if it's a Metric object
-            metrics_dict[self.metric.name] = str(self.metric.value)
-
-        performance = PerformanceInfo(
-            metrics=metrics_dict,
-            training_data_info={
-                name: {
-                    "modality": data.structure.modality,
-                    "features": data.structure.features,
-                    "structure": data.structure.details,
-                }
-                for name, data in self.training_data.items()
-            },
-        )
+        metrics_dict = {self.metric.name: str(self.metric.value)} if isinstance(self.metric, Metric) else {}
+
+        # Dataset structures are computed on access, so each one is read only once
+        training_data_info = {}
+        for name, data in self.training_data.items():
+            structure = data.structure
+            training_data_info[name] = {
+                "modality": structure.modality,
+                "features": structure.features,
+                "structure": structure.details,
+            }
+
+        performance = PerformanceInfo(metrics=metrics_dict, training_data_info=training_data_info)
 
         # Create code info
         code = CodeInfo(
@@ -418,17 +597,5 @@ class Model:
             implementation=implementation,
             performance=performance,
             code=code,
-            training_date=self.metadata.get("creation_date", "Unknown"),
-            rationale=self.metadata.get("selection_rationale", "Unknown"),
-            provider=self.metadata.get("provider", "Unknown"),
-            task_type=self.metadata.get("task_type", "Unknown"),
-            domain=self.metadata.get("domain", "Unknown"),
-            behavior=self.metadata.get("behavior", "Unknown"),
-            preprocessing_summary=self.metadata.get("preprocessing_summary", "Unknown"),
-            architecture_summary=self.metadata.get("architecture_summary", "Unknown"),
-            training_procedure=self.metadata.get("training_procedure", "Unknown"),
-            evaluation_metric=self.metadata.get("evaluation_metric", "Unknown"),
-            inference_behavior=self.metadata.get("inference_behavior", "Unknown"),
-            strengths=self.metadata.get("strengths", "Unknown"),
-            limitations=self.metadata.get("limitations", "Unknown"),
+            **{field: self.metadata.get(key, "Unknown") for field, key in _DESCRIPTION_METADATA_FIELDS},
         )
@@ -0,0 +1,207 @@
+"""
+Tests for the smolagents utilities.
+
+This module verifies:
+1. Identical completion requests are served from the response cache, which clients can share
+2. Cached responses expire and are evicted as configured
+3. Failed model calls are not cached
+4. Prompt templates are parsed once and returned as independent copies
+5. Multiple tool calls in one agent step are executed in parallel, and all of their failures are reported
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from smolagents import LiteLLMModel, tool
+from smolagents.models import ChatMessage, ChatMessageToolCall, ChatMessageToolCallDefinition
+
+from plexe.internal.common.utils.agents import (
+    CachedLiteLLMModel,
+    ParallelToolCallingAgent,
+    _load_prompt_templates,
+    get_prompt_templates,
+)
+
+
+def _messages(text: str) -> list:
+    return [{"role": "user", "content": [{"type": "text", "text": text}]}]
+
+
+def test_identical_requests_are_cached():
+    """Test that a repeated request does not call the underlying model again."""
+    model = CachedLiteLLMModel(model_id="openai/gpt-4o-mini")
+    with patch.object(LiteLLMModel, "__call__", return_value=ChatMessage(role="assistant", content="hi")) as mock:
+        first = model(_messages("hello"))
+        second = model(_messages("hello"))
+
+    assert mock.call_count == 1
+    assert first.content == second.content == "hi"
+    assert first is not second
+    assert model.last_input_token_count == 0
+
+
+def test_shared_clients_share_responses_but_not_token_counts():
+    """Test that a shared client serves cached responses, while keeping its own token counts."""
+    model = CachedLiteLLMModel(model_id="openai/gpt-4o-mini")
+    shared = model.share()
+    response = ChatMessage(role="assistant", content="hi")
+
+    def call(self, *args, **kwargs):
+        self.last_input_token_count, self.last_output_token_count = 10, 2
+        return response
+
+    with patch.object(LiteLLMModel, "__call__", autospec=True, side_effect=call) as mock:
+        model(_messages("hello"))
+        assert shared(_messages("hello")).content == "hi"
+
+    assert mock.call_count == 1
+    assert (model.last_input_token_count, model.last_output_token_count) == (10, 2)
+    assert (shared.last_input_token_count, shared.last_output_token_count) == (0, 0)
+
+
+def test_different_requests_are_not_cached():
+    """Test that requests with different messages or stop sequences miss the cache."""
+    model = CachedLiteLLMModel(model_id="openai/gpt-4o-mini")
+    with patch.object(LiteLLMModel, "__call__", return_value=ChatMessage(role="assistant", content="hi")) as mock:
+        model(_messages("hello"))
+        model(_messages("goodbye"))
+        model(_messages("hello"), stop_sequences=["Observation:"])
+
+    assert mock.call_count == 3
+
+
+def test_expired_and_evicted_entries_are_refetched():
+    """Test that entries past their TTL, or beyond the maximum cache size, are requested again."""
+    model = CachedLiteLLMModel(model_id="openai/gpt-4o-mini", max_entries=1, ttl=None)
+    with patch.object(LiteLLMModel, "__call__", return_value=ChatMessage(role="assistant", content="hi")) as mock:
+        model(_messages("a"))
+        model(_messages("b"))
+        model(_messages("a"))
+        assert mock.call_count == 3
+
+        model.ttl = -1
+        model(_messages("a"))
+        assert mock.call_count == 4
+
+
+def test_failed_requests_are_not_cached():
+    """Test that a request whose model call fails is sent to the model again when it is retried."""
+    model = CachedLiteLLMModel(model_id="openai/gpt-4o-mini")
+    responses = [RuntimeError("rate limited"), ChatMessage(role="assistant", content="hi")]
+
+    with patch.object(LiteLLMModel, "__call__", side_effect=responses) as mock:
+        with pytest.raises(RuntimeError):
+            model(_messages("hello"))
+        assert model(_messages("hello")).content == "hi"
+
+    assert mock.call_count == 2
+
+
+def test_prompt_templates_are_loaded_once_and_copied():
+    """Test that prompt templates are parsed once, and that modifying a returned template does not affect others."""
+    first = get_prompt_templates("toolcalling_agent.yaml", "mls_prompt_templates.yaml")
+    first["managed_agent"]["task"] = "modified"
+    second = get_prompt_templates("toolcalling_agent.yaml", "mls_prompt_templates.yaml")
+
+    assert second["managed_agent"]["task"] != "modified"
+    assert "system_prompt" in second
+    assert _load_prompt_templates.cache_info().hits >= 1
+
+
+@tool
+def slow_square(x: int) -> int:
+    """
+    Squares a number, slowly.
+
+    Args:
+        x: the number to square
+    """
+    time.sleep(0.5)
+    return x * x
+
+
+def _tool_call(name: str, arguments: dict, call_id: str) -> ChatMessageToolCall:
+    return ChatMessageToolCall(
+        function=ChatMessageToolCallDefinition(name=name, arguments=arguments), id=call_id, type="function"
+    )
+
+
+def test_parallel_tool_calls_are_executed_concurrently():
+    """Test that all tool calls in a step are executed, concurrently, before the agent returns its final answer."""
+    responses = iter(
+        [
+            ChatMessage(
+                role="assistant",
+                tool_calls=[_tool_call("slow_square", {"x": i}, f"call_{i}") for i in range(1, 4)],
+            ),
+            ChatMessage(role="assistant", tool_calls=[_tool_call("final_answer", {"answer": "done"}, "call_final")]),
+        ]
+    )
+    model = MagicMock(side_effect=lambda *args, **kwargs: next(responses))
+    model.last_input_token_count = model.last_output_token_count = 0
+    agent = ParallelToolCallingAgent(tools=[slow_square], model=model, max_steps=3, verbosity_level=0)
+
+    start = time.monotonic()
+    answer = agent.run("Square 1, 2 and 3")
+    elapsed = time.monotonic() - start
+
+    action_step = agent.memory.steps[1]
+    assert answer == "done"
+    assert action_step.model_input_messages and action_step.model_output_message.tool_calls
+    assert [call.name for call in action_step.tool_calls] == ["slow_square"] * 3
+    assert all(f"call_{i}):\n{i * i}" in action_step.observations for i in range(1, 4))
+    assert elapsed < 1.2
+    assert model.call_count == 2
+
+
+def test_failed_model_calls_record_their_input():
+    """Test that a step whose model call fails still records the messages that were sent to the model."""
+    model = MagicMock(side_effect=RuntimeError("model unavailable"))
+    model.last_input_token_count = model.last_output_token_count = 0
+    agent = ParallelToolCallingAgent(tools=[slow_square], model=model, max_steps=1, verbosity_level=0)
+
+    agent.run("Square 1, 2 and 3")
+
+    action_step = agent.memory.steps[1]
+    assert "model unavailable" in str(action_step.error)
+    assert action_step.model_input_messages
+    assert action_step.model_input_messages == agent.input_messages
+
+
+@tool
+def checked_square(x: int) -> int:
+    """
+    Squares a non-negative number.
+
+    Args:
+        x: the number to square
+    """
+    if x < 0:
+        raise ValueError(f"negative input {x}")
+    return x * x
+
+
+def test_all_failed_parallel_tool_calls_are_reported():
+    """Test that every failed tool call in a step is reported to the model, alongside the successful calls."""
+    responses = iter(
+        [
+            ChatMessage(
+                role="assistant",
+                tool_calls=[_tool_call("checked_square", {"x": x}, f"call_{i}") for i, x in enumerate([-1, 2, -3])],
+            ),
+            ChatMessage(role="assistant", tool_calls=[_tool_call("final_answer", {"answer": "done"}, "call_final")]),
+        ]
+    )
+    model = MagicMock(side_effect=lambda *args, **kwargs: next(responses))
+    model.last_input_token_count = model.last_output_token_count = 0
+    agent = ParallelToolCallingAgent(tools=[checked_square], model=model, max_steps=3, verbosity_level=0)
+
+    assert agent.run("Square -1, 2 and -3") == "done"
+
+    action_step = agent.memory.steps[1]
+    error = str(action_step.error)
+    assert "call_1):\n4" in action_step.observations
+    assert "2 of 3 parallel tool calls failed" in error
+    assert "'checked_square' (call id: call_0)" in error and "negative input -1" in error
+    assert "'checked_square' (call id: call_2)" in error and "negative input -3" in error
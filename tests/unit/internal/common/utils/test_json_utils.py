@@ -0,0 +1,57 @@
+"""
+Tests for the JSON serialisation helpers.
+
+This module verifies:
+1. Canonical serialisation is independent of key order
+2. The standard library fallback produces the same output as orjson, both compact and indented
+3. Unsupported values can be rejected instead of converted to strings
+"""
+
+from enum import Enum
+from unittest.mock import patch
+
+import pytest
+
+from plexe.internal.common.utils import json_utils
+from plexe.internal.common.utils.json_utils import dumps_canonical, dumps_indented
+
+
+class Colour(str, Enum):
+    RED = "red"
+
+
+PAYLOAD = {"b": [1, 2.5, None, True], "a": {"y": "text", "x": Colour.RED}, "c": object}
+
+
+def test_canonical_output_is_independent_of_key_order():
+    """Test that dictionaries with the same content serialise identically regardless of insertion order."""
+    reordered = {"c": object, "a": {"x": Colour.RED, "y": "text"}, "b": [1, 2.5, None, True]}
+
+    assert dumps_canonical(PAYLOAD) == dumps_canonical(reordered)
+    assert dumps_canonical(PAYLOAD).startswith(b'{"a":{"x":"red","y":"text"},"b":[1,2.5,null,true]')
+
+
+@pytest.mark.skipif(json_utils.orjson is None, reason="orjson is not installed")
+def test_fallback_matches_orjson():
+    """Test that the standard library fallback produces the same bytes as orjson."""
+    with patch.object(json_utils, "orjson", None):
+        fallback = dumps_canonical(PAYLOAD)
+
+    assert dumps_canonical(PAYLOAD) == fallback
+    assert dumps_canonical({"big": 2**70}) == b'{"big":1180591620717411303424}'
+
+
+@pytest.mark.skipif(json_utils.orjson is None, reason="orjson is not installed")
+def test_indented_fallback_matches_orjson():
+    """Test that indented output is the same with orjson and with the standard library fallback."""
+    schema = {"bedrooms": "int", "location": {"city": "str"}}
+    with patch.object(json_utils, "orjson", None):
+        fallback = dumps_indented(schema)
+
+    assert dumps_indented(schema) == fallback == '{\n  "bedrooms": "int",\n  "location": {\n    "city": "str"\n  }\n}'
+
+
+def test_canonical_without_default_rejects_unsupported_values():
+    """Test that unsupported values raise a TypeError when no default conversion is given."""
+    with pytest.raises(TypeError):
+        dumps_canonical({"value": object()}, default=None)
@@ -0,0 +1,88 @@
+"""
+Tests for the predictor code utilities.
+
+This module verifies:
+1. Predictor code is compiled into a module once and reused
+2. Predictor code is compiled without asserts and docstrings, wherever it is loaded
+3. Predictor modules have a spec and report their source in tracebacks
+4. The module cache is bounded, and keeps sys.modules and linecache consistent with it
+"""
+
+import linecache
+import sys
+import traceback
+from collections import OrderedDict
+
+import pytest
+
+from plexe.internal.common.utils import predictor_utils
+from plexe.internal.common.utils.predictor_utils import load_predictor_module
+from plexe.internal.models.validation.primitives.predict import PredictorValidator
+
+PREDICTOR_CODE = """
+class PredictorImplementation:
+    def __init__(self, artifacts):
+        self.artifacts = list(artifacts)
+
+    def predict(self, inputs):
+        return {"prediction": len(self.artifacts)}
+"""
+
+ASSERTING_CODE = '"""Predictor module."""\nassert False, "asserts are stripped"\n'
+
+
+def test_predictor_module_is_reused_for_identical_code():
+    """Test that loading the same predictor code twice returns the same compiled module."""
+    first = load_predictor_module(PREDICTOR_CODE)
+    second = load_predictor_module(PREDICTOR_CODE)
+    other = load_predictor_module(PREDICTOR_CODE + "\n# a different predictor\n")
+
+    assert first is second
+    assert first is not other
+    assert first.PredictorImplementation([]).predict({}) == {"prediction": 0}
+
+
+def test_predictor_code_is_compiled_without_asserts_and_docstrings():
+    """Test that the predictor module, and the module checked by the validator, both strip asserts and docstrings."""
+    assert load_predictor_module(ASSERTING_CODE).__doc__ is None
+    assert PredictorValidator._load_module(ASSERTING_CODE).__doc__ is None
+
+
+def test_predictor_module_is_registered_with_spec():
+    """Test that the predictor module has a spec, is importable by name, and reports its source in tracebacks."""
+    module = load_predictor_module(PREDICTOR_CODE + "\ndef fail():\n    raise ValueError('boom')\n")
+
+    assert sys.modules[module.__spec__.name] is module
+    assert module.__file__.startswith("<predictor:")
+    with pytest.raises(ValueError) as exc_info:
+        module.fail()
+    assert "raise ValueError('boom')" in "".join(traceback.format_tb(exc_info.tb))
+
+
+def test_least_recently_used_modules_are_evicted(monkeypatch):
+    """Test that the module cache is bounded, and evicted modules are removed from sys.modules and linecache."""
+    monkeypatch.setattr(predictor_utils, "_MODULE_CACHE", OrderedDict())
+    monkeypatch.setattr(predictor_utils, "_MODULE_CACHE_SIZE", 2)
+    first, second = load_predictor_module("X = 1\n"), load_predictor_module("X = 2\n")
+    load_predictor_module("X = 1\n")
+
+    third = load_predictor_module("X = 3\n")
+
+    assert list(predictor_utils._MODULE_CACHE.values()) == [first, third]
+    assert second.__spec__.name not in sys.modules and second.__file__ not in linecache.cache
+    assert sys.modules[first.__spec__.name] is first and first.__file__ in linecache.cache
+    assert load_predictor_module("X = 2\n") is not second
+
+
+def test_failed_modules_are_not_registered():
+    """Test that predictor code failing to execute leaves no entries in sys.modules or linecache."""
+    code = "raise RuntimeError('broken predictor')\n"
+    names_before = set(sys.modules)
+
+    with pytest.raises(RuntimeError, match="broken predictor"):
+        load_predictor_module(code)
+
+    assert not any(name.startswith("plexe_predictor_") for name in set(sys.modules) - names_before)
+    assert not any(
+        name.startswith("<predictor:") and code in "".join(entry[2]) for name, entry in linecache.cache.items()
+    )
@@ -0,0 +1,45 @@
+"""
+Tests for the Pydantic model utilities.
+
+This module verifies:
+1. Schemas are formatted as mappings of field names to type names
+2. Formatted schemas are cached per model class, without sharing mutable results
+3. Type adapters are created once per model class and validate data against the schema
+"""
+
+import pytest
+from pydantic import ValidationError, create_model
+
+from plexe.internal.common.utils import pydantic_utils
+from plexe.internal.common.utils.pydantic_utils import format_schema, get_type_adapter
+
+
+def test_format_schema():
+    """Test that a model is formatted into field names and type names."""
+    schema = create_model("Input", bedrooms=(int, ...), price=(float, ...), city=(str, ...))
+
+    assert format_schema(schema) == {"bedrooms": "int", "price": "float", "city": "str"}
+    assert format_schema(None) == {}
+
+
+def test_format_schema_is_cached_per_class():
+    """Test that repeated formatting of a class hits the cache, and that results can be modified safely."""
+    schema = create_model("Output", price=(float, ...))
+    hits = pydantic_utils._format_schema_cached.cache_info().hits
+
+    first = format_schema(schema)
+    first["price"] = "modified"
+
+    assert format_schema(schema) == {"price": "float"}
+    assert pydantic_utils._format_schema_cached.cache_info().hits == hits + 1
+
+
+def test_type_adapter_is_cached_per_class():
+    """Test that the same adapter is returned for a class, and that it validates data against the schema."""
+    schema = create_model("Input", bedrooms=(int, ...))
+    adapter = get_type_adapter(schema)
+
+    assert get_type_adapter(schema) is adapter
+    assert adapter.validate_python({"bedrooms": 3}).bedrooms == 3
+    with pytest.raises(ValidationError):
+        adapter.validate_python({"bedrooms": "three"})
@@ -0,0 +1,45 @@
+"""
+Tests for the response formatting tools.
+
+This module verifies:
+1. The ML research agent's plans are returned together under the 'plans' key
+2. Missing, empty or malformed plans are rejected with a ValueError
+"""
+
+import pytest
+
+from plexe.internal.models.tools.response_formatting import format_final_mls_agent_response
+
+
+def test_mls_response_returns_all_plans():
+    """Test that valid plans are returned in order, keeping only the headline and plan fields."""
+    plans = [
+        {"headline": "Gradient boosting", "plan": "Train an XGBoost regressor.", "notes": "extra"},
+        {"headline": "Linear model", "plan": "Fit a ridge regression."},
+    ]
+
+    assert format_final_mls_agent_response(plans=plans) == {
+        "plans": [
+            {"headline": "Gradient boosting", "plan": "Train an XGBoost regressor."},
+            {"headline": "Linear model", "plan": "Fit a ridge regression."},
+        ]
+    }
+
+
+@pytest.mark.parametrize("plans", [[], None, "Train an XGBoost regressor.", {"headline": "h", "plan": "p"}])
+def test_mls_response_rejects_missing_plans(plans):
+    """Test that an empty list, or a value that is not a list, is rejected."""
+    with pytest.raises(ValueError, match="Expected a non-empty list of plans"):
+        format_final_mls_agent_response(plans=plans)
+
+
+@pytest.mark.parametrize(
+    "invalid_plan",
+    [{"plan": "Fit a ridge regression."}, {"headline": "Linear model"}, {"headline": "", "plan": "p"}, "a plan"],
+)
+def test_mls_response_rejects_plans_without_headline_or_plan(invalid_plan):
+    """Test that plans missing their headline or plan are rejected, reporting their positions."""
+    plans = [{"headline": "Gradient boosting", "plan": "Train an XGBoost regressor."}, invalid_plan]
+
+    with pytest.raises(ValueError, match=r"invalid plans at positions \[1\]"):
+        format_final_mls_agent_response(plans=plans)
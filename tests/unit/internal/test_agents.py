@@ -0,0 +1,170 @@
+"""
+Tests for the multi-agent ML engineering system.
+
+This module verifies:
+1. The orchestrator's result is processed into a ModelGenerationResult
+2. The reported metric comparison method is parsed correctly
+3. Agents using the same model share one LLM response cache
+4. Batches of tasks run in turn on separate agent systems, without sharing per-run registry objects
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from smolagents.memory import ActionStep, FinalAnswerStep
+
+from plexe.internal.agents import PlexeAgent
+from plexe.internal.common.registries.objects import ObjectRegistry
+from plexe.internal.models.entities.artifact import Artifact
+from plexe.internal.models.entities.code import Code
+from plexe.internal.models.entities.metric import ComparisonMethod
+
+INFERENCE_CODE = """
+class PredictorImplementation:
+    def __init__(self, artifacts):
+        self.artifacts = list(artifacts)
+
+    def predict(self, inputs):
+        return {"prediction": len(self.artifacts)}
+"""
+
+
+@pytest.fixture
+def registry():
+    """Provide an empty object registry, cleared again after the test."""
+    registry = ObjectRegistry()
+    registry.clear()
+    yield registry
+    registry.clear()
+
+
+def _agent_returning(result: dict) -> PlexeAgent:
+    """Create a PlexeAgent whose orchestrator returns the given result without calling any LLM."""
+    agent = PlexeAgent()
+    steps = [ActionStep(step_number=1, duration=0.1), FinalAnswerStep(final_answer=result)]
+    agent.__dict__["manager_agent"] = MagicMock(run=MagicMock(return_value=iter(steps)))
+    return agent
+
+
+def _result(**overrides) -> dict:
+    result = {
+        "training_code_id": "train",
+        "inference_code_id": "infer",
+        "performance": {"name": "accuracy", "value": 0.9, "comparison_method": "HIGHER_IS_BETTER"},
+        "metadata": {"model_type": "tree", "framework": "sklearn"},
+        "model_artifact_names": ["model.pkl"],
+    }
+    result.update(overrides)
+    return result
+
+
+def test_run_builds_result_from_selected_artifacts(registry):
+    """Test that only the artifacts named in the agent result are passed to the predictor."""
+    registry.register(Code, "train", Code("print('train')"))
+    registry.register(Code, "infer", Code(INFERENCE_CODE))
+    registry.register(Artifact, "model.pkl", Artifact.from_data("model.pkl", b"model"))
+    registry.register(Artifact, "stale.pkl", Artifact.from_data("stale.pkl", b"stale"))
+
+    generated = _agent_returning(_result()).run("task", additional_args={})
+
+    assert generated.training_source_code == "print('train')"
+    assert generated.inference_source_code == INFERENCE_CODE
+    assert [a.name for a in generated.model_artifacts] == ["model.pkl"]
+    assert generated.predictor.predict({}) == {"prediction": 1}
+    assert generated.performance.name == "accuracy"
+    assert generated.metadata["framework"] == "sklearn"
+
+
+def test_run_raises_on_missing_code(registry):
+    """Test that a result referencing unknown code is reported as a processing failure."""
+    with pytest.raises(RuntimeError, match="Failed to process agent result"):
+        _agent_returning(_result()).run("task", additional_args={})
+
+
+@pytest.mark.parametrize(
+    "comparison_str, expected",
+    [
+        ("LOWER_IS_BETTER", ComparisonMethod.LOWER_IS_BETTER),
+        ("ComparisonMethod.LOWER_IS_BETTER", ComparisonMethod.LOWER_IS_BETTER),
+        (" lower_is_better ", ComparisonMethod.LOWER_IS_BETTER),
+        ("LOWER_IS_BETTER (rmse)", ComparisonMethod.LOWER_IS_BETTER),
+        ("Lower is better: ComparisonMethod.LOWER_IS_BETTER.", ComparisonMethod.LOWER_IS_BETTER),
+        ("", ComparisonMethod.HIGHER_IS_BETTER),
+        ("unknown", ComparisonMethod.HIGHER_IS_BETTER),
+    ],
+)
+def test_run_parses_comparison_method(registry, comparison_str, expected):
+    """Test that the reported comparison method is parsed, falling back to higher is better."""
+    registry.register(Code, "train", Code("print('train')"))
+    registry.register(Code, "infer", Code(INFERENCE_CODE))
+    registry.register(Artifact, "model.pkl", Artifact.from_data("model.pkl", b"model"))
+    performance = {"name": "loss", "value": 0.1, "comparison_method": comparison_str}
+
+    generated = _agent_returning(_result(performance=performance)).run("task", additional_args={})
+
+    assert generated.performance.comparator.comparison_method == expected
+
+
+def test_agents_share_response_caches_for_the_same_model():
+    """Test that agents configured with the same model ID share a response cache, but use separate clients."""
+    agent = PlexeAgent(
+        orchestrator_model_id="openai/gpt-4o",
+        ml_researcher_model_id="openai/gpt-4o-mini",
+        ml_engineer_model_id="openai/gpt-4o",
+        ml_ops_engineer_model_id="openai/gpt-4o",
+    )
+    manager, mle, mlops = agent.manager_agent.model, agent.mle_agent.model, agent.mlops_engineer.model
+
+    assert manager._cache is mle._cache is mlops._cache
+    assert manager._lock is mle._lock
+    assert len({id(manager), id(mle), id(mlops)}) == 3
+    assert agent.ml_research_agent.model._cache is not manager._cache
+    assert agent.ml_research_agent.model.model_id == "openai/gpt-4o-mini"
+
+
+def test_run_defaults_missing_performance(registry):
+    """Test that a missing or malformed performance entry falls back to default metric values."""
+    registry.register(Code, "train", Code("print('train')"))
+    registry.register(Code, "infer", Code(INFERENCE_CODE))
+    registry.register(Artifact, "model.pkl", Artifact.from_data("model.pkl", b"model"))
+
+    generated = _agent_returning(_result(performance="not a dict")).run("task", additional_args={})
+
+    assert generated.performance.name == "unknown"
+    assert generated.performance.value == 0.0
+    assert generated.performance.comparator.comparison_method == ComparisonMethod.HIGHER_IS_BETTER
+
+
+def test_run_batch_runs_tasks_in_turn_on_separate_agents_with_shared_clients(registry):
+    """Test that batched tasks run one at a time on separate agents, each starting from the same registry."""
+    agent = PlexeAgent()
+    registry.register(Code, "shared", Code("print('shared')"))
+    runners, running, peak = [], [], []
+    lock = threading.Lock()
+
+    def fake_run(self, task, additional_args):
+        with lock:
+            runners.append(self)
+            running.append(task)
+            peak.append(len(running))
+        # Tools register per-run objects under fixed names, which must not collide between tasks
+        registry.register(Code, "predictor_input_sample", Code(task))
+        time.sleep(0.05)
+        with lock:
+            running.remove(task)
+        if task == "bad":
+            raise RuntimeError("failed")
+        return registry.get(Code, "predictor_input_sample").code.upper()
+
+    with patch.object(PlexeAgent, "run", fake_run):
+        results = asyncio.run(agent.arun_batch([("a", {}), ("bad", {}), ("c", {})]))
+
+    assert results[0] == "A" and results[2] == "C"
+    assert isinstance(results[1], RuntimeError)
+    assert max(peak) == 1
+    assert len({id(r) for r in runners}) == 3 and agent not in runners
+    assert all(r._models is agent._models for r in runners)
+    assert registry.list() == [ObjectRegistry._get_uri(Code, "shared")]
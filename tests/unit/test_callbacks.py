@@ -65,9 +65,8 @@ class TestCallbacks(unittest.TestCase):
             # The on_build_start should be called once
             callback.on_build_start.assert_called_once()
 
-            # In the new agentic architecture, on_build_end may be called multiple times
-            # (at least once in model.py, possibly again in the agent implementation)
-            assert callback.on_build_end.call_count >= 1
+            # The on_build_end should be called once
+            callback.on_build_end.assert_called_once()
 
             # Check that the agent was called
             mock_run.assert_called_once()
@@ -174,8 +173,7 @@ class TestCallbacks(unittest.TestCase):
             # Note: in the agentic architecture, iteration callbacks might be handled differently
             callback.on_build_start.assert_called_once()
 
-            # In the new agentic architecture, on_build_end may be called multiple times
-            assert callback.on_build_end.call_count >= 1
+            callback.on_build_end.assert_called_once()
 
             # We no longer check for iteration callbacks as they might be handled differently in the agent
 
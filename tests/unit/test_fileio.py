@@ -0,0 +1,38 @@
+"""
+Unit tests for saving and loading models.
+"""
+
+from pydantic import create_model
+
+from plexe.fileio import load_model, save_model
+from plexe.internal.common.utils.model_state import ModelState
+from plexe.models import Model
+
+PREDICTOR_CODE = """
+from plexe.internal.models.interfaces.predictor import Predictor
+
+
+class PredictorImplementation(Predictor):
+    def __init__(self, artifacts):
+        pass
+
+    def predict(self, inputs):
+        assert False, "asserts are stripped, as in the predictor of a freshly built model"
+        return {"price": inputs["bedrooms"] * 100.0}
+"""
+
+
+def test_loaded_predictor_is_compiled_like_a_built_predictor(tmp_path):
+    """Test that a saved model's predictor is loaded through the shared predictor compilation."""
+    model = Model(
+        intent="Predict housing prices based on features",
+        input_schema=create_model("Input", bedrooms=(int, ...)),
+        output_schema=create_model("Output", price=(float, ...)),
+    )
+    model.state = ModelState.READY
+    model.trainer_source = "print('train')"
+    model.predictor_source = PREDICTOR_CODE
+
+    loaded = load_model(save_model(model, str(tmp_path / "model.tar.gz")))
+
+    assert loaded.predict({"bedrooms": 2}) == {"price": 200.0}
@@ -0,0 +1,296 @@
+"""
+Unit tests for the Model class.
+"""
+
+import copy
+import os
+import pickle
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from pydantic import create_model
+
+from plexe.internal.common.datasets.adapter import DatasetAdapter
+from plexe.internal.common.provider import ProviderConfig
+from plexe.internal.common.utils.model_state import ModelState
+from plexe.internal.models.entities.metric import ComparisonMethod, Metric, MetricComparator
+from plexe.models import Model, _to_provider_config
+
+
+def _model(intent: str = "Predict housing prices based on features") -> Model:
+    return Model(
+        intent=intent,
+        input_schema=create_model("Input", bedrooms=(int, ...)),
+        output_schema=create_model("Output", price=(float, ...)),
+    )
+
+
+def test_identifier_is_stable_for_intent():
+    """Test that the intent part of the identifier is the same across models, and unique per model."""
+    first, second, other = _model(), _model(), _model("Classify emails as spam")
+
+    assert first.identifier.startswith("model-f82e4913add7ae09-")
+    assert first.identifier.split("-")[1] == second.identifier.split("-")[1]
+    assert first.identifier.split("-")[1] != other.identifier.split("-")[1]
+    assert first.identifier != second.identifier
+
+
+def test_run_id_is_filesystem_safe():
+    """Test that the run ID contains only characters that are safe in directory names."""
+    model = _model()
+
+    assert re.fullmatch(r"run-\d{8}-\d{6}-\d{6}", model.run_id)
+    assert model.working_dir == f"./workdir/{model.run_id}/"
+
+
+def _ready_model(**kwargs) -> Model:
+    model = Model(intent="Predict housing prices based on features", **kwargs)
+    model.predictor = MagicMock()
+    model.predictor.predict.side_effect = lambda x: {"price": float(x["bedrooms"]) * 100}
+    model.state = ModelState.READY
+    return model
+
+
+def test_predictions_are_cached_for_repeated_inputs():
+    """Test that repeated inputs are served from the prediction cache, evicting the least recently used inputs."""
+    model = _ready_model(predict_cache_size=2)
+
+    assert model.predict({"bedrooms": 1, "garden": True}) == {"price": 100.0}
+    model.predict({"garden": True, "bedrooms": 1})["price"] = -1.0
+    assert model.predict({"bedrooms": 1, "garden": True}) == {"price": 100.0}
+    assert model.predictor.predict.call_count == 1
+
+    model.predict({"bedrooms": 2})
+    model.predict({"bedrooms": 3})
+    model.predict({"bedrooms": 1, "garden": True})
+    assert model.predictor.predict.call_count == 4
+
+
+def test_predictions_are_not_cached_by_default_or_for_unserialisable_inputs():
+    """Test that the predictor is always called when caching is disabled, or the input cannot be hashed."""
+    uncached, cached = _ready_model(), _ready_model(predict_cache_size=8)
+
+    for _ in range(2):
+        uncached.predict({"bedrooms": 1})
+        cached.predict({"bedrooms": 1, "extra": object()})
+
+    assert uncached.predictor.predict.call_count == 2
+    assert cached.predictor.predict.call_count == 2
+
+
+def test_inputs_with_ambiguous_serialisations_are_not_cached():
+    """Test that inputs whose JSON could equal that of a different input bypass the cache."""
+    model = _ready_model(predict_cache_size=8)
+    model.predictor.predict.side_effect = lambda x: {"price": repr(x)}
+
+    pairs = [({1: 3}, {"1": 3}), ({"bedrooms": (1, 2)}, {"bedrooms": [1, 2]}), ({"bedrooms": float("nan")}, {})]
+    for ambiguous, plain in pairs:
+        assert model.predict(ambiguous) == {"price": repr(ambiguous)}
+        assert model.predict(plain) == {"price": repr(plain)}
+        assert model.predict(ambiguous) == {"price": repr(ambiguous)}
+    assert model.predict({"bedrooms": None}) == {"price": repr({"bedrooms": None})}
+
+
+def test_prediction_cache_is_safe_for_concurrent_use():
+    """Test that concurrent predictions, which constantly evict each other's cache entries, all succeed."""
+
+    class YieldingOrderedDict(OrderedDict):
+        def move_to_end(self, key, last=True):
+            super().move_to_end(key, last)
+            time.sleep(0.001)  # let other threads run, to expose races between cache operations
+
+    model = _ready_model(predict_cache_size=1)
+    model._predict_cache = YieldingOrderedDict()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda i: model.predict({"bedrooms": i // 2 % 2}), range(300)))
+
+    assert results == [{"price": float(i // 2 % 2) * 100} for i in range(300)]
+    assert len(model._predict_cache) == 1
+
+
+def test_predict_validates_inputs_and_outputs():
+    """Test that invalid inputs or outputs are reported as prediction errors when validation is requested."""
+    model = _ready_model(
+        input_schema=create_model("Input", bedrooms=(int, ...)),
+        output_schema=create_model("Output", price=(float, ...)),
+    )
+
+    assert model.predict({"bedrooms": 2}, validate_input=True, validate_output=True) == {"price": 200.0}
+    with pytest.raises(RuntimeError, match="Error during prediction"):
+        model.predict({"bedrooms": "two"}, validate_input=True)
+    model.predictor.predict.side_effect = lambda x: {"price": "unknown"}
+    with pytest.raises(RuntimeError, match="Error during prediction"):
+        model.predict({"bedrooms": 2}, validate_output=True)
+
+
+def test_build_coerces_datasets_in_order():
+    """Test that several datasets are coerced and registered in the order they were given."""
+    model = _model()
+    frames = [pd.DataFrame({"bedrooms": [i], "price": [i * 100.0]}) for i in range(3)]
+
+    with patch("plexe.internal.agents.PlexeAgent.run", side_effect=RuntimeError("stop after coercion")):
+        with pytest.raises(RuntimeError, match="stop after coercion"):
+            model.build(datasets=frames, provider="openai/gpt-4o-mini", max_iterations=1)
+
+    assert list(model.training_data) == ["dataset_0", "dataset_1", "dataset_2"]
+    assert [data.to_pandas()["bedrooms"][0] for data in model.training_data.values()] == [0, 1, 2]
+
+
+def test_working_directory_is_created_on_build(tmp_path, monkeypatch):
+    """Test that creating a model does not touch the filesystem, and that building it creates its working directory."""
+    monkeypatch.chdir(tmp_path)
+    model = _model()
+
+    assert not os.path.exists(model.working_dir)
+    with patch("plexe.internal.agents.PlexeAgent.run", side_effect=RuntimeError("stop after setup")):
+        with pytest.raises(RuntimeError, match="stop after setup"):
+            model.build(datasets=[pd.DataFrame({"bedrooms": [1]})], max_iterations=1)
+    assert os.path.isdir(model.working_dir)
+
+
+def test_describe_reads_metadata_fields():
+    """Test that the description is populated from the model metadata, defaulting missing entries to 'Unknown'."""
+    model = _model()
+    model.metadata.update({"creation_date": "2025-01-01", "selection_rationale": "best score", "framework": "sklearn"})
+
+    description = model.describe()
+
+    assert description.training_date == "2025-01-01"
+    assert description.rationale == "best score"
+    assert description.implementation.framework == "sklearn"
+    assert description.limitations == "Unknown"
+    assert description.schemas.input == {"bedrooms": "int"}
+
+
+def test_describe_includes_metric_and_training_data():
+    """Test that the description includes the model metric and the structure of each training dataset."""
+    model = _model()
+    model.metric = Metric(name="accuracy", value=0.9, comparator=MetricComparator(ComparisonMethod.HIGHER_IS_BETTER))
+    model.training_data = {"dataset_0": DatasetAdapter.coerce(pd.DataFrame({"bedrooms": [1, 2]}))}
+
+    performance = model.describe().performance
+
+    assert performance.metrics == {"accuracy": "0.9"}
+    assert performance.training_data_info["dataset_0"]["features"] == ["bedrooms"]
+    assert performance.training_data_info["dataset_0"]["structure"]["num_rows"] == 2
+
+
+def test_provider_is_converted_to_config():
+    """Test that a provider string is expanded to a configuration, and that configurations are used as given."""
+    config = ProviderConfig(default_provider="openai/gpt-4o", tool_provider="openai/gpt-4o-mini")
+
+    assert _to_provider_config(config) is config
+    assert _to_provider_config("anthropic/claude-3-7-sonnet-latest").orchestrator_provider == (
+        "anthropic/claude-3-7-sonnet-latest"
+    )
+
+
+def test_build_stores_results_and_provider_metadata():
+    """Test that a successful build stores the generated model and records the providers used in its metadata."""
+    model = _model()
+    generated = MagicMock(model_artifacts=[], test_performance=None, metadata={"framework": "sklearn"})
+    provider = ProviderConfig(default_provider="openai/gpt-4o", tool_provider="openai/gpt-4o-mini")
+
+    with patch("plexe.internal.agents.PlexeAgent.run", return_value=generated):
+        model.build(datasets=[pd.DataFrame({"bedrooms": [1]})], provider=provider, max_iterations=1)
+
+    assert model.state == ModelState.READY
+    assert model.predictor is generated.predictor
+    assert model.metadata == {
+        "framework": "sklearn",
+        "provider": "openai/gpt-4o",
+        "orchestrator_provider": "openai/gpt-4o",
+        "research_provider": "openai/gpt-4o",
+        "engineer_provider": "openai/gpt-4o",
+        "ops_provider": "openai/gpt-4o",
+        "tool_provider": "openai/gpt-4o-mini",
+    }
+
+
+def test_model_has_no_instance_dict():
+    """Test that models store their attributes in slots, rejecting attributes that are not declared."""
+    model = _model()
+
+    assert not hasattr(model, "__dict__")
+    with pytest.raises(AttributeError):
+        model.undeclared_attribute = True
+
+
+def test_predictor_errors_are_reported_as_prediction_errors():
+    """Test that errors raised by the predictor are wrapped, whether or not validation is requested."""
+    model = _ready_model()
+    model.predictor.predict.side_effect = KeyError("bedrooms")
+
+    with pytest.raises(RuntimeError, match="Error during prediction"):
+        model.predict({})
+    model.state = ModelState.BUILDING
+    with pytest.raises(RuntimeError, match="not ready"):
+        model.predict({"bedrooms": 1})
+
+
+def test_metrics_are_updated_when_the_metric_changes():
+    """Test that get_metrics reflects the current metric, and reuses its result while the metric is unchanged."""
+    model = _model()
+    assert model.get_metrics() is None
+
+    model.metric = Metric(name="rmse", value=1.5, comparator=MetricComparator(ComparisonMethod.LOWER_IS_BETTER))
+    assert model.get_metrics() == {"rmse": 1.5}
+    assert model.get_metrics() is model.get_metrics()
+
+    model.metric = None
+    assert model.get_metrics() is None
+
+
+def test_model_can_be_copied_and_pickled():
+    """Test that a model can be deep-copied and pickled, with an empty prediction cache in the copy."""
+    model = _model()
+    model.predict_cache_size = 4
+    model.metric = Metric(name="rmse", value=1.5, comparator=MetricComparator(ComparisonMethod.LOWER_IS_BETTER))
+    model._predict_cache[b"key"] = {"price": 1.0}
+    # Schemas created with create_model cannot be pickled, so pickling is tested on a model without schemas
+    schemaless = Model(intent=model.intent, predict_cache_size=4)
+
+    for original, copied in ((model, copy.deepcopy(model)), (schemaless, pickle.loads(pickle.dumps(schemaless)))):
+        assert copied.identifier == original.identifier
+        assert copied.input_schema is original.input_schema
+        assert copied.get_metrics() == original.get_metrics()
+        assert copied.predict_cache_size == 4
+        assert len(copied._predict_cache) == 0
+        assert copied._predict_cache_lock is not original._predict_cache_lock
+
+
+def test_predictions_running_during_a_rebuild_are_not_cached_for_the_new_predictor():
+    """Test that a prediction from the previous predictor, completing after a rebuild, is not served afterwards."""
+    model = _ready_model(
+        predict_cache_size=4,
+        input_schema=create_model("Input", bedrooms=(int, ...)),
+        output_schema=create_model("Output", price=(float, ...)),
+    )
+    started, release = threading.Event(), threading.Event()
+
+    def slow_predict(x):
+        started.set()
+        release.wait(timeout=5)
+        return {"price": -1.0}
+
+    model.predictor.predict.side_effect = slow_predict
+    new_predictor = MagicMock()
+    new_predictor.predict.side_effect = lambda x: {"price": 1.0}
+    generated = MagicMock(predictor=new_predictor, model_artifacts=[], test_performance=None, metadata={})
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        stale = executor.submit(model.predict, {"bedrooms": 1})
+        started.wait(timeout=5)
+        with patch("plexe.internal.agents.PlexeAgent.run", return_value=generated):
+            model.build(datasets=[pd.DataFrame({"bedrooms": [1]})], max_iterations=1)
+        release.set()
+        assert stale.result(timeout=5) == {"price": -1.0}
+
+    assert model.predict({"bedrooms": 1}) == {"price": 1.0}